@@ -5,15 +5,22 @@ Generates AXI Stream transactions.
 
 import cocotb
 from cocotb.triggers import RisingEdge, Timer
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
 import random
 
 from ...base import Driver, Transaction
 
 
+# Maps keep byte 0 to ASCII '0' and any nonzero keep byte to '1' so a keep
+# list can be parsed as a binary int
+_KEEP_DIGITS = b'0' + b'1' * 255
+
+
 class AxiStreamTransaction(Transaction):
     """AXI Stream transaction class."""
     
+    __slots__ = ('data', 'keep', 'last', 'user', 'dest', 'id')
+    
     def __init__(self, data: List[int], keep: Optional[List[int]] = None, 
                  last: bool = False, user: int = 0, dest: int = 0, id_val: int = 0,
                  timestamp: float = 0.0):
@@ -75,12 +82,26 @@ class AxiStreamDriver(Driver):
         self.tdest = signals.get('tdest')
         self.tid = signals.get('tid')
         
+        # Optional signal presence is fixed, so resolve it once instead of per beat
+        self._has_tkeep = bool(self.tkeep)
+        self._has_tlast = bool(self.tlast)
+        self._has_tuser = bool(self.tuser)
+        self._has_tdest = bool(self.tdest)
+        self._has_tid = bool(self.tid)
+        
         # Configuration
         self.data_width = len(self.tdata)
         self.backpressure_probability = config.get('backpressure_prob', 0.0) if config else 0.0
         self.min_gap_cycles = config.get('min_gap_cycles', 0) if config else 0
         self.max_gap_cycles = config.get('max_gap_cycles', 0) if config else 0
         
+        # Per-instance RNG so a configured seed reproduces this driver's stimulus
+        # independently of other components sharing the global random module;
+        # without one, seed from the global generator so cocotb's RANDOM_SEED
+        # still reproduces the run
+        self._rng = random.Random(config['seed'] if config and 'seed' in config
+                                  else random.getrandbits(64))
+        
     async def send_transaction(self, transaction: AxiStreamTransaction) -> None:
         """
         Send a single AXI Stream transaction.
@@ -91,48 +112,26 @@ class AxiStreamDriver(Driver):
         if not self._active:
             return
             
-        # Convert data to appropriate width
-        data_bytes = len(transaction.data)
-        bus_bytes = self.data_width // 8
-        
-        # Split transaction into bus-width chunks
-        for offset in range(0, data_bytes, bus_bytes):
-            chunk_data = transaction.data[offset:offset + bus_bytes]
-            chunk_keep = transaction.keep[offset:offset + bus_bytes]
-            is_last_chunk = (offset + bus_bytes >= data_bytes)
+        # Sideband values are constant for the whole transaction
+        if self._has_tuser:
+            self.tuser.value = transaction.user
+        if self._has_tdest:
+            self.tdest.value = transaction.dest
+        if self._has_tid:
+            self.tid.value = transaction.id
             
-            # Pad chunk to bus width
-            while len(chunk_data) < bus_bytes:
-                chunk_data.append(0)
-                chunk_keep.append(0)
-                
+        # Pack every beat up front so the handshake loop only drives signals
+        for data_value, keep_value, last_value in self._pack_beats(transaction):
             # Set up signals
             self.tvalid.value = 1
-            
-            # Pack data into single value
-            data_value = 0
-            for i, byte_val in enumerate(chunk_data):
-                data_value |= (byte_val << (i * 8))
             self.tdata.value = data_value
             
             # Set optional signals
-            if self.tkeep:
-                keep_value = 0
-                for i, keep_val in enumerate(chunk_keep):
-                    keep_value |= (keep_val << i)
+            if self._has_tkeep:
                 self.tkeep.value = keep_value
                 
-            if self.tlast:
-                self.tlast.value = 1 if (transaction.last and is_last_chunk) else 0
-                
-            if self.tuser:
-                self.tuser.value = transaction.user
-                
-            if self.tdest:
-                self.tdest.value = transaction.dest
-                
-            if self.tid:
-                self.tid.value = transaction.id
+            if self._has_tlast:
+                self.tlast.value = last_value
                 
             # Wait for ready
             await RisingEdge(self.clock)
@@ -145,9 +144,42 @@ class AxiStreamDriver(Driver):
         
         # Optional gap between transactions
         if self.min_gap_cycles > 0 or self.max_gap_cycles > 0:
-            gap_cycles = random.randint(self.min_gap_cycles, self.max_gap_cycles)
+            gap_cycles = self._rng.randint(self.min_gap_cycles, self.max_gap_cycles)
             await self.wait_clock_cycles(gap_cycles)
             
+    def _pack_beats(self, transaction: AxiStreamTransaction) -> List[Tuple[int, int, int]]:
+        """
+        Split a transaction into bus-width beats.
+        
+        Args:
+            transaction: Transaction to split
+            
+        Returns:
+            List of (tdata, tkeep, tlast) values, one per beat
+        """
+        data = bytes(transaction.data)
+        # Lane 0 is the least significant keep bit, so the keep lanes are
+        # reversed once here and each beat's slice is parsed MSB-first
+        keep_digits = bytes(transaction.keep[::-1]).translate(_KEEP_DIGITS)
+        data_bytes = len(data)
+        keep_bytes = len(keep_digits)
+        bus_bytes = self.data_width // 8
+        last_offset = data_bytes - 1 - (data_bytes - 1) % bus_bytes if data_bytes else 0
+        
+        beats = []
+        for offset in range(0, data_bytes, bus_bytes):
+            # Byte 0 goes in the low lane; a short final chunk needs no
+            # padding since absent high lanes stay zero
+            data_value = int.from_bytes(data[offset:offset + bus_bytes], 'little')
+            # Lanes past the end of a short keep list are not kept
+            keep_end = max(keep_bytes - offset, 0)
+            keep_lanes = keep_digits[max(keep_end - bus_bytes, 0):keep_end]
+            keep_value = int(keep_lanes, 2) if keep_lanes else 0
+            last_value = 1 if (transaction.last and offset == last_offset) else 0
+            beats.append((data_value, keep_value, last_value))
+            
+        return beats
+        
     async def send_random_transaction(self, min_size: int = 1, max_size: int = 64) -> AxiStreamTransaction:
         """
         Generate and send a random transaction.
@@ -159,15 +191,15 @@ class AxiStreamDriver(Driver):
         Returns:
             The generated transaction
         """
-        size = random.randint(min_size, max_size)
-        data = [random.randint(0, 255) for _ in range(size)]
+        size = self._rng.randint(min_size, max_size)
+        data = list(self._rng.randbytes(size))
         
         transaction = AxiStreamTransaction(
             data=data,
             last=True,
-            user=random.randint(0, 255),
-            dest=random.randint(0, 15),
-            id_val=random.randint(0, 15)
+            user=self._rng.randint(0, 255),
+            dest=self._rng.randint(0, 15),
+            id_val=self._rng.randint(0, 15)
         )
         
         await self.send_transaction(transaction)
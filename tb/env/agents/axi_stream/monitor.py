@@ -5,12 +5,17 @@ Observes AXI Stream transactions.
 
 import cocotb
 from cocotb.triggers import RisingEdge, ReadOnly
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict
+from itertools import compress
 
 from ...base import Monitor, Transaction
 from .driver import AxiStreamTransaction
 
 
+# Keep byte value -> its eight keep bits as one 0/1 byte per lane, LSB first
+_KEEP_BYTE_LANES = tuple(bytes((value >> i) & 1 for i in range(8)) for value in range(256))
+
+
 class AxiStreamMonitor(Monitor):
     """
     AXI Stream monitor implementation.
@@ -43,17 +48,29 @@ class AxiStreamMonitor(Monitor):
         self.tdest = signals.get('tdest')
         self.tid = signals.get('tid')
         
+        self._has_tkeep = bool(self.tkeep)
+        self._has_tlast = bool(self.tlast)
+        self._has_tuser = bool(self.tuser)
+        self._has_tdest = bool(self.tdest)
+        self._has_tid = bool(self.tid)
+        
         # Configuration
         self.data_width = len(self.tdata)
         self.bus_bytes = self.data_width // 8
         
-        # Current transaction being assembled
-        self._current_transaction: Optional[List[int]] = None
-        self._current_keep: Optional[List[int]] = None
+        # Keep decoding constants, fixed by the bus width
+        self._keep_mask = (1 << self.bus_bytes) - 1
+        self._keep_value_bytes = (self.bus_bytes + 7) // 8
+        self._all_keep = b'\x01' * self.bus_bytes
+        
+        # Current transaction being assembled, one byte per lane (keep as 0/1)
+        self._current_transaction: Optional[bytearray] = None
+        self._current_keep: Optional[bytearray] = None
         self._current_user: int = 0
         self._current_dest: int = 0
         self._current_id: int = 0
         self._last_transaction: Optional[AxiStreamTransaction] = None
+        self._bytes_observed = 0
         
     async def _monitor_interface(self) -> None:
         """Monitor AXI Stream interface for transactions."""
@@ -69,39 +86,31 @@ class AxiStreamMonitor(Monitor):
         # Get data value
         data_value = int(self.tdata.value)
         
-        # Extract bytes from data
-        beat_data = []
-        beat_keep = []
+        # Extract bytes from data (byte 0 is the least significant)
+        beat_data = data_value.to_bytes(self.bus_bytes, 'little')
         
-        for i in range(self.bus_bytes):
-            byte_val = (data_value >> (i * 8)) & 0xFF
-            beat_data.append(byte_val)
-            
-            # Get keep bit if available
-            if self.tkeep:
-                keep_value = int(self.tkeep.value)
-                keep_bit = (keep_value >> i) & 1
-                beat_keep.append(keep_bit)
-            else:
-                beat_keep.append(1)  # Default to all valid
+        # Get keep bits if available, expanding them a keep byte at a time
+        if self._has_tkeep:
+            keep_value = int(self.tkeep.value) & self._keep_mask
+            keep_bytes = keep_value.to_bytes(self._keep_value_bytes, 'little')
+            beat_keep = b''.join([_KEEP_BYTE_LANES[b] for b in keep_bytes])[:self.bus_bytes]
+        else:
+            beat_keep = self._all_keep  # Default to all valid
                 
-        # Get other signal values
-        user_val = int(self.tuser.value) if self.tuser else 0
-        dest_val = int(self.tdest.value) if self.tdest else 0
-        id_val = int(self.tid.value) if self.tid else 0
-        last_val = bool(self.tlast.value) if self.tlast else False
+        last_val = bool(self.tlast.value) if self._has_tlast else False
         
-        # Start new transaction if needed
+        # Start new transaction if needed; sideband values are only taken
+        # from the first beat, so they are read only then
         if self._current_transaction is None:
-            self._current_transaction = []
-            self._current_keep = []
-            self._current_user = user_val
-            self._current_dest = dest_val
-            self._current_id = id_val
+            self._current_transaction = bytearray()
+            self._current_keep = bytearray()
+            self._current_user = int(self.tuser.value) if self._has_tuser else 0
+            self._current_dest = int(self.tdest.value) if self._has_tdest else 0
+            self._current_id = int(self.tid.value) if self._has_tid else 0
             
         # Add beat data to current transaction
-        self._current_transaction.extend(beat_data)
-        self._current_keep.extend(beat_keep)
+        self._current_transaction += beat_data
+        self._current_keep += beat_keep
         
         # Complete transaction if last beat
         if last_val:
@@ -113,16 +122,13 @@ class AxiStreamMonitor(Monitor):
             return
             
         # Filter out invalid bytes based on keep signals
-        valid_data = []
-        for i, (data_byte, keep_bit) in enumerate(zip(self._current_transaction, self._current_keep)):
-            if keep_bit:
-                valid_data.append(data_byte)
+        valid_data = list(compress(self._current_transaction, self._current_keep))
                 
         # Create transaction object
         timestamp = cocotb.utils.get_sim_time('ns')
         transaction = AxiStreamTransaction(
             data=valid_data,
-            keep=self._current_keep[:len(valid_data)],
+            keep=list(self._current_keep[:len(valid_data)]),
             last=True,
             user=self._current_user,
             dest=self._current_dest,
@@ -132,10 +138,11 @@ class AxiStreamMonitor(Monitor):
         
         # Store as last transaction and notify observers
         self._last_transaction = transaction
+        self._bytes_observed += len(valid_data)
         self.notify_observers(transaction)
         
-        self.logger.debug(f"Captured transaction: {len(valid_data)} bytes, "
-                         f"user={self._current_user}, dest={self._current_dest}, id={self._current_id}")
+        self.logger.debug("Captured transaction: %d bytes, user=%d, dest=%d, id=%d",
+                          len(valid_data), self._current_user, self._current_dest, self._current_id)
         
         # Reset current transaction
         self._current_transaction = None
@@ -157,15 +164,9 @@ class AxiStreamMonitor(Monitor):
         """
         return {
             'transactions_observed': self.transactions_observed,
-            'bytes_observed': sum(len(txn.data) for txn in self._get_all_transactions()),
+            'bytes_observed': self._bytes_observed,
         }
         
-    def _get_all_transactions(self) -> List[AxiStreamTransaction]:
-        """Get all observed transactions (for stats)."""
-        # In a full implementation, we might store all transactions
-        # For now, just return the last one if available
-        return [self._last_transaction] if self._last_transaction else []
-        
     async def wait_for_packet(self, timeout_cycles: Optional[int] = None) -> AxiStreamTransaction:
         """
         Wait for a complete packet (transaction with last=True).
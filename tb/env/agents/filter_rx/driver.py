@@ -5,16 +5,31 @@ Handles filter configuration and packet generation for filter_rx_pipeline testin
 
 import cocotb
 from cocotb.triggers import RisingEdge, Timer
-from typing import Any, Optional, Dict, List, Tuple
+from typing import Any, Callable, Optional, Dict, List, Tuple
+from operator import attrgetter
 import random
 
 from ...base import Driver
 from ..axi_stream import AxiStreamDriver, AxiStreamTransaction
 
 
+# Rule keys that FilterPacket.matches_filter compares, in the order it checks
+# them; any other key is ignored
+_MATCH_ORDER = ('dst_ip', 'dst_port', 'src_ip', 'src_port',
+                'src_mac', 'dst_mac', 'protocol', 'eth_type')
+MATCH_FIELDS = frozenset(_MATCH_ORDER)
+
+# Header values drawn for non-matching packets: IPv4/IPv6/ARP, TCP/UDP/ICMP
+_ETH_TYPES = (0x0800, 0x86DD, 0x0806)
+_PROTOCOLS = (0x06, 0x11, 0x01)
+
+
 class FilterPacket:
     """Packet with filter-specific metadata."""
     
+    __slots__ = ('data', 'src_mac', 'dst_mac', 'eth_type', 'src_ip', 'dst_ip',
+                 'src_port', 'dst_port', 'protocol')
+    
     def __init__(self, data: List[int], src_mac: int = 0, dst_mac: int = 0, 
                  eth_type: int = 0x0800, src_ip: int = 0, dst_ip: int = 0,
                  src_port: int = 0, dst_port: int = 0, protocol: int = 0x11):
@@ -60,27 +75,53 @@ class FilterPacket:
         Returns:
             True if packet matches the rule
         """
-        # Check each field in the filter rule
-        if 'src_mac' in filter_rule and self.src_mac != filter_rule['src_mac']:
-            return False
-        if 'dst_mac' in filter_rule and self.dst_mac != filter_rule['dst_mac']:
+        # Check each field in the filter rule, most selective first: the
+        # filter keys on destination IP/port, so mismatches exit earliest there
+        if 'dst_ip' in filter_rule and self.dst_ip != filter_rule['dst_ip']:
             return False
-        if 'eth_type' in filter_rule and self.eth_type != filter_rule['eth_type']:
+        if 'dst_port' in filter_rule and self.dst_port != filter_rule['dst_port']:
             return False
         if 'src_ip' in filter_rule and self.src_ip != filter_rule['src_ip']:
             return False
-        if 'dst_ip' in filter_rule and self.dst_ip != filter_rule['dst_ip']:
-            return False
         if 'src_port' in filter_rule and self.src_port != filter_rule['src_port']:
             return False
-        if 'dst_port' in filter_rule and self.dst_port != filter_rule['dst_port']:
+        if 'src_mac' in filter_rule and self.src_mac != filter_rule['src_mac']:
+            return False
+        if 'dst_mac' in filter_rule and self.dst_mac != filter_rule['dst_mac']:
             return False
         if 'protocol' in filter_rule and self.protocol != filter_rule['protocol']:
             return False
+        if 'eth_type' in filter_rule and self.eth_type != filter_rule['eth_type']:
+            return False
             
         return True
 
 
+def _compile_filter_rule(filter_rule: Dict[str, Any]) -> Callable[[FilterPacket], bool]:
+    """
+    Build a predicate equivalent to FilterPacket.matches_filter for one rule.
+    
+    The rule's keys are resolved once, so each call is a single attrgetter
+    and tuple comparison instead of a membership test per possible field.
+    
+    Args:
+        filter_rule: Filter rule dictionary
+        
+    Returns:
+        Function returning True if a packet matches the rule
+    """
+    fields = tuple(name for name in _MATCH_ORDER if name in filter_rule)
+    if not fields:
+        return lambda packet: True
+        
+    # attrgetter returns a bare value for one field and a tuple for several
+    get_fields = attrgetter(*fields)
+    expected = tuple(filter_rule[name] for name in fields)
+    if len(fields) == 1:
+        expected = expected[0]
+    return lambda packet: get_fields(packet) == expected
+
+
 class FilterRxDriver(Driver):
     """
     Filter RX pipeline specific driver.
@@ -108,6 +149,11 @@ class FilterRxDriver(Driver):
         # Filter rule storage
         self.filter_rules: List[Dict[str, Any]] = []
         
+        # Per-instance RNG so a configured seed reproduces the generated packets;
+        # without one, seed from the global generator (and so RANDOM_SEED)
+        self._rng = random.Random(config['seed'] if config and 'seed' in config
+                                  else random.getrandbits(64))
+        
     async def configure_filter_rule(self, rule_index: int, rule: Dict[str, Any]) -> None:
         """
         Configure a filter rule.
@@ -131,7 +177,7 @@ class FilterRxDriver(Driver):
         """Write filter rule to hardware configuration interface."""
         # This would implement the actual hardware configuration protocol
         # For now, just log the operation
-        self.logger.debug(f"Writing rule {rule_index} to hardware: {rule}")
+        self.logger.debug("Writing rule %d to hardware: %s", rule_index, rule)
         await self.wait_clock_cycles(1)
         
     async def send_filter_packet(self, packet: FilterPacket) -> None:
@@ -172,14 +218,14 @@ class FilterRxDriver(Driver):
         
         # Create packet with rule values
         packet = FilterPacket(
-            data=[random.randint(0, 255) for _ in range(size)],
-            src_mac=rule.get('src_mac', random.randint(0, 0xFFFFFFFFFFFF)),
-            dst_mac=rule.get('dst_mac', random.randint(0, 0xFFFFFFFFFFFF)),
+            data=list(self._rng.randbytes(size)),
+            src_mac=rule.get('src_mac', self._rng.randint(0, 0xFFFFFFFFFFFF)),
+            dst_mac=rule.get('dst_mac', self._rng.randint(0, 0xFFFFFFFFFFFF)),
             eth_type=rule.get('eth_type', 0x0800),
-            src_ip=rule.get('src_ip', random.randint(0, 0xFFFFFFFF)),
-            dst_ip=rule.get('dst_ip', random.randint(0, 0xFFFFFFFF)),
-            src_port=rule.get('src_port', random.randint(0, 0xFFFF)),
-            dst_port=rule.get('dst_port', random.randint(0, 0xFFFF)),
+            src_ip=rule.get('src_ip', self._rng.randint(0, 0xFFFFFFFF)),
+            dst_ip=rule.get('dst_ip', self._rng.randint(0, 0xFFFFFFFF)),
+            src_port=rule.get('src_port', self._rng.randint(0, 0xFFFF)),
+            dst_port=rule.get('dst_port', self._rng.randint(0, 0xFFFF)),
             protocol=rule.get('protocol', 0x11)
         )
         
@@ -197,21 +243,31 @@ class FilterRxDriver(Driver):
         """
         max_attempts = 100
         
+        # A rule that constrains none of the match fields accepts every packet,
+        # so no random draw can miss it; go straight to the fallback packet
+        if any(MATCH_FIELDS.isdisjoint(rule) for rule in self.filter_rules):
+            max_attempts = 0
+            
+        # Resolve each rule's fields once rather than on every attempt
+        matchers = [_compile_filter_rule(rule) for rule in self.filter_rules]
+        
         for _ in range(max_attempts):
+            # One draw supplies both MACs, both IPs and both ports (192 bits)
+            bits = self._rng.getrandbits(192)
             packet = FilterPacket(
-                data=[random.randint(0, 255) for _ in range(size)],
-                src_mac=random.randint(0, 0xFFFFFFFFFFFF),
-                dst_mac=random.randint(0, 0xFFFFFFFFFFFF),
-                eth_type=random.choice([0x0800, 0x86DD, 0x0806]),
-                src_ip=random.randint(0, 0xFFFFFFFF),
-                dst_ip=random.randint(0, 0xFFFFFFFF),
-                src_port=random.randint(0, 0xFFFF),
-                dst_port=random.randint(0, 0xFFFF),
-                protocol=random.choice([0x06, 0x11, 0x01])
+                data=list(self._rng.randbytes(size)),
+                src_mac=bits & 0xFFFFFFFFFFFF,
+                dst_mac=(bits >> 48) & 0xFFFFFFFFFFFF,
+                eth_type=self._rng.choice(_ETH_TYPES),
+                src_ip=(bits >> 96) & 0xFFFFFFFF,
+                dst_ip=(bits >> 128) & 0xFFFFFFFF,
+                src_port=(bits >> 160) & 0xFFFF,
+                dst_port=bits >> 176,
+                protocol=self._rng.choice(_PROTOCOLS)
             )
             
             # Check if packet matches any rule
-            matches_any = any(packet.matches_filter(rule) for rule in self.filter_rules)
+            matches_any = any(match(packet) for match in matchers)
             
             if not matches_any:
                 return packet
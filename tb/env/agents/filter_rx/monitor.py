@@ -6,7 +6,9 @@ Monitors filter pipeline outputs and collects filtering statistics.
 import cocotb
 from cocotb.triggers import RisingEdge, ReadOnly
 from typing import Any, Optional, Dict, List
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 
 from ...base import Monitor, Transaction
 from ..axi_stream import AxiStreamMonitor, AxiStreamTransaction
@@ -52,9 +54,9 @@ class FilterRxMonitor(Monitor):
         self.packets_dropped = 0
         self.rule_hits: Dict[int, int] = {}
         
-        # Recent filter results
-        self._recent_results: List[FilterResult] = []
+        # Recent filter results (bounded; oldest entries fall off automatically)
         self._max_recent_results = 1000
+        self._recent_results: deque = deque(maxlen=self._max_recent_results)
         
         # Connect to output monitor
         self.output_monitor.add_observer(self._on_output_packet)
@@ -73,10 +75,6 @@ class FilterRxMonitor(Monitor):
     def _add_result(self, result: FilterResult) -> None:
         """Add filter result to recent results list."""
         self._recent_results.append(result)
-        
-        # Maintain max size
-        if len(self._recent_results) > self._max_recent_results:
-            self._recent_results.pop(0)
             
         # Update rule statistics
         if result.rule_index is not None:
@@ -115,7 +113,7 @@ class FilterRxMonitor(Monitor):
         )
         
         self._add_result(result)
-        self.logger.debug(f"Packet dropped: {drop_reason}")
+        self.logger.debug("Packet dropped: %s", drop_reason)
         
     def _decode_drop_reason(self, reason_code: int) -> str:
         """Decode drop reason from status signal."""
@@ -164,10 +162,11 @@ class FilterRxMonitor(Monitor):
         Returns:
             List of recent filter results
         """
-        if count is None:
-            return self._recent_results.copy()
+        total = len(self._recent_results)
+        if not count or count >= total:
+            return list(self._recent_results)
         else:
-            return self._recent_results[-count:] if count <= len(self._recent_results) else self._recent_results.copy()
+            return list(islice(self._recent_results, total - count, None))
             
     def check_expected_drops(self, expected_drop_count: int, timeout_cycles: int = 1000) -> bool:
         """
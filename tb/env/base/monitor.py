@@ -15,6 +15,8 @@ from .component import Component
 class Transaction:
     """Base transaction class for monitor observations."""
     
+    __slots__ = ('timestamp',)
+    
     def __init__(self, timestamp: float = 0.0):
         self.timestamp = timestamp
         
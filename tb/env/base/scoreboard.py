@@ -4,6 +4,7 @@ Provides transaction checking and comparison functionality.
 """
 
 import cocotb
+from cocotb.triggers import Timer
 from typing import Any, Optional, Dict, List, Callable
 import logging
 from collections import deque
@@ -77,7 +78,7 @@ class Scoreboard(Component):
             transaction: Expected transaction
         """
         self._expected_queue.append(transaction)
-        self.logger.debug(f"Added expected transaction: {transaction}")
+        self.logger.debug("Added expected transaction: %s", transaction)
         self._try_check_transactions()
         
     def add_actual_transaction(self, transaction: Transaction) -> None:
@@ -88,7 +89,7 @@ class Scoreboard(Component):
             transaction: Actual transaction observed
         """
         self._actual_queue.append(transaction)
-        self.logger.debug(f"Added actual transaction: {transaction}")
+        self.logger.debug("Added actual transaction: %s", transaction)
         self._try_check_transactions()
         
     def _try_check_transactions(self) -> None:
@@ -101,7 +102,7 @@ class Scoreboard(Component):
             
             if self._compare_transactions(expected, actual):
                 self._stats.matches += 1
-                self.logger.debug(f"Transaction match: {expected}")
+                self.logger.debug("Transaction match: %s", expected)
             else:
                 self._stats.mismatches += 1
                 self.logger.error(f"Transaction mismatch!")
@@ -187,9 +188,6 @@ class Scoreboard(Component):
         Args:
             timeout_ms: Timeout in milliseconds
         """
-        import cocotb
-        from cocotb.triggers import Timer
-        
         start_time = cocotb.utils.get_sim_time('ms')
         
         while not self.check_empty():
@@ -8,7 +8,7 @@ from cocotb.triggers import RisingEdge, Timer
 from typing import Any, Optional, Dict, List
 import logging
 
-from .base import Component, Config, Scoreboard, Coverage
+from .base import Component, Config, Scoreboard, Coverage, CoverageType
 from .agents.axi_stream import AxiStreamDriver, AxiStreamMonitor
 from .agents.filter_rx import FilterRxDriver, FilterRxMonitor
 
@@ -140,8 +140,6 @@ class FilterRxPipelineEnvironment(Component):
         
     def _setup_filter_coverage(self) -> None:
         """Set up filter-specific coverage points."""
-        from .base import CoverageType
-        
         # Filter rule coverage
         self.coverage.create_group("filter_rules", "Coverage of filter rule usage")
         
@@ -171,8 +169,6 @@ class FilterRxPipelineEnvironment(Component):
         
     def _setup_packet_coverage(self) -> None:
         """Set up packet size and type coverage."""
-        from .base import CoverageType
-        
         # Packet size coverage  
         self.coverage.create_group("packet_sizes", "Coverage of packet sizes")
         size_bins = ["small_64", "medium_256", "large_1024", "jumbo_1500"]
@@ -5,6 +5,8 @@ CI/CD Monitoring and Status Dashboard for Filter RX Pipeline
 Provides real-time monitoring of test status, performance trends, and system health
 """
 
+import contextlib
+import io
 import json
 import os
 import sys
@@ -26,11 +28,36 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
     END = '\033[0m'
+    
+    @classmethod
+    def disable(cls):
+        """Blank every color code so output carries no escape sequences."""
+        for name in ('RED', 'GREEN', 'YELLOW', 'BLUE', 'PURPLE', 'CYAN',
+                     'WHITE', 'BOLD', 'UNDERLINE', 'END'):
+            setattr(cls, name, '')
+
+# Only emit ANSI escapes when writing to a terminal (not when piped or logged)
+if not sys.stdout.isatty():
+    Colors.disable()
 
 def colored_print(text, color=Colors.WHITE):
     """Print colored text to terminal."""
     print(f"{color}{text}{Colors.END}")
 
+# Separator rules for the dashboard header and section titles
+HEADER_RULE = "=" * 80
+SECTION_RULE = "-" * 40
+
+# Fixed status lines, colored once at import instead of on every refresh
+RUNNING_LINES = {
+    True: f"{Colors.GREEN}🟢 Status: Tests currently running{Colors.END}",
+    False: f"{Colors.RED}🔴 Status: No tests running{Colors.END}",
+}
+RESULT_LINES = {
+    "passing": f"{Colors.GREEN}✅ Result: PASSING{Colors.END}",
+    "failing": f"{Colors.RED}❌ Result: FAILING{Colors.END}",
+}
+
 class CIMonitor:
     """CI/CD monitoring and dashboard."""
     
@@ -38,6 +65,8 @@ class CIMonitor:
         self.project_root = Path(__file__).parent
         self.results_dir = self.project_root / "results"
         self.config_file = self.project_root / ".ci_config.yml"
+        self.status_file = self.results_dir / "status.json"
+        self.benchmark_file = self.results_dir / "benchmark.json"
         
         # Ensure results directory exists
         self.results_dir.mkdir(exist_ok=True)
@@ -45,31 +74,12 @@ class CIMonitor:
     def get_git_info(self):
         """Get current git information."""
         try:
-            branch = subprocess.check_output(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"], 
-                cwd=self.project_root,
-                text=True
-            ).strip()
-            
-            commit = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"], 
-                cwd=self.project_root,
-                text=True
-            ).strip()[:8]
-            
-            # Check for uncommitted changes
-            status = subprocess.check_output(
-                ["git", "status", "--porcelain"], 
+            # Branch, commit and working tree state from a single git call
+            output = subprocess.check_output(
+                ["git", "status", "--porcelain=v2", "--branch"], 
                 cwd=self.project_root,
                 text=True
-            ).strip()
-            
-            return {
-                "branch": branch,
-                "commit": commit,
-                "clean": len(status) == 0,
-                "status": status
-            }
+            )
         except subprocess.CalledProcessError:
             return {
                 "branch": "unknown",
@@ -77,6 +87,26 @@ class CIMonitor:
                 "clean": True,
                 "status": ""
             }
+        
+        branch = commit = "unknown"
+        changes = []
+        for line in output.splitlines():
+            if line.startswith("# branch.oid "):
+                commit = line[len("# branch.oid "):][:8]
+            elif line.startswith("# branch.head "):
+                branch = line[len("# branch.head "):]
+                if branch == "(detached)":
+                    branch = "HEAD"
+            elif not line.startswith("#"):
+                # Every non-header line is an uncommitted change
+                changes.append(line)
+        
+        return {
+            "branch": branch,
+            "commit": commit,
+            "clean": not changes,
+            "status": "\n".join(changes)
+        }
     
     def get_test_status(self):
         """Get current test execution status."""
@@ -89,10 +119,11 @@ class CIMonitor:
         
         # Check for running tests (look for simulator processes)
         try:
+            # Only the exit status matters, so discard the output
             result = subprocess.run(
                 ["pgrep", "-f", "verilator|questa|xcelium"],
-                capture_output=True,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
             status["running"] = result.returncode == 0
         except FileNotFoundError:
@@ -100,24 +131,20 @@ class CIMonitor:
             pass
         
         # Load latest test results
-        status_file = self.results_dir / "status.json"
-        if status_file.exists():
-            try:
-                with open(status_file) as f:
-                    data = json.load(f)
-                    status["last_run"] = data.get("timestamp")
-                    status["results"] = data
-            except (json.JSONDecodeError, KeyError):
-                pass
+        try:
+            with open(self.status_file) as f:
+                data = json.load(f)
+                status["last_run"] = data.get("timestamp")
+                status["results"] = data
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
         
         # Load performance data
-        benchmark_file = self.results_dir / "benchmark.json"
-        if benchmark_file.exists():
-            try:
-                with open(benchmark_file) as f:
-                    status["performance"] = json.load(f)
-            except (json.JSONDecodeError, KeyError):
-                pass
+        try:
+            with open(self.benchmark_file) as f:
+                status["performance"] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
         
         return status
     
@@ -125,18 +152,26 @@ class CIMonitor:
         """Get summary of recent log files."""
         logs = []
         
-        # Find recent log files
-        for log_file in self.results_dir.glob("*.log"):
-            try:
-                stat = log_file.stat()
+        # Find recent log files in a single directory pass
+        try:
+            entries = os.scandir(self.results_dir)
+        except OSError:
+            return logs
+        
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".log") or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
                 logs.append({
-                    "name": log_file.name,
+                    "name": entry.name,
                     "size": stat.st_size,
                     "modified": datetime.fromtimestamp(stat.st_mtime),
-                    "path": str(log_file)
+                    "path": entry.path
                 })
-            except OSError:
-                continue
         
         # Sort by modification time (newest first)
         logs.sort(key=lambda x: x["modified"], reverse=True)
@@ -145,9 +180,9 @@ class CIMonitor:
     
     def display_header(self):
         """Display dashboard header."""
-        print("=" * 80)
+        print(HEADER_RULE)
         colored_print("🚀 Filter RX Pipeline CI/CD Monitor", Colors.BOLD + Colors.CYAN)
-        print("=" * 80)
+        print(HEADER_RULE)
         
         # Current time
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -163,18 +198,16 @@ class CIMonitor:
         
         print()
     
-    def display_test_status(self):
+    def display_test_status(self, status=None):
         """Display current test status."""
         colored_print("🧪 Test Execution Status", Colors.BOLD + Colors.BLUE)
-        print("-" * 40)
+        print(SECTION_RULE)
         
-        status = self.get_test_status()
+        if status is None:
+            status = self.get_test_status()
         
         # Running status
-        if status["running"]:
-            colored_print("🟢 Status: Tests currently running", Colors.GREEN)
-        else:
-            colored_print("🔴 Status: No tests running", Colors.RED)
+        print(RUNNING_LINES[status["running"]])
         
         # Last run information
         if status["last_run"]:
@@ -200,12 +233,10 @@ class CIMonitor:
         # Test results summary
         if status["results"]:
             test_status = status["results"].get("status", "unknown")
-            if test_status == "passing":
-                colored_print(f"✅ Result: {test_status.upper()}", Colors.GREEN)
-            elif test_status == "failing":
-                colored_print(f"❌ Result: {test_status.upper()}", Colors.RED)
-            else:
-                colored_print(f"❓ Result: {test_status.upper()}", Colors.YELLOW)
+            result_line = RESULT_LINES.get(test_status)
+            if result_line is None:
+                result_line = f"{Colors.YELLOW}❓ Result: {test_status.upper()}{Colors.END}"
+            print(result_line)
             
             # Total tests
             total_tests = status["results"].get("total_tests", 0)
@@ -217,12 +248,13 @@ class CIMonitor:
         
         print()
     
-    def display_performance_metrics(self):
+    def display_performance_metrics(self, status=None):
         """Display performance metrics."""
         colored_print("⚡ Performance Metrics", Colors.BOLD + Colors.PURPLE)
-        print("-" * 40)
+        print(SECTION_RULE)
         
-        status = self.get_test_status()
+        if status is None:
+            status = self.get_test_status()
         perf = status.get("performance", {})
         
         if not perf:
@@ -285,7 +317,7 @@ class CIMonitor:
     def display_log_summary(self):
         """Display recent log files summary."""
         colored_print("📝 Recent Log Files", Colors.BOLD + Colors.WHITE)
-        print("-" * 40)
+        print(SECTION_RULE)
         
         logs = self.get_log_summary()
         
@@ -294,9 +326,10 @@ class CIMonitor:
             print()
             return
         
+        now = datetime.now()
         for log in logs[:5]:  # Show top 5
             size_kb = log["size"] / 1024
-            time_ago = datetime.now() - log["modified"]
+            time_ago = now - log["modified"]
             
             if time_ago.seconds < 300:  # Less than 5 minutes
                 time_color = Colors.GREEN
@@ -313,7 +346,7 @@ class CIMonitor:
     def display_quick_actions(self):
         """Display available quick actions."""
         colored_print("🎯 Quick Actions", Colors.BOLD + Colors.GREEN)
-        print("-" * 40)
+        print(SECTION_RULE)
         
         actions = [
             ("./run_ci_tests.sh --test-suite quick", "Run quick test suite"),
@@ -337,13 +370,7 @@ class CIMonitor:
                 os.system('clear' if os.name == 'posix' else 'cls')
                 
                 # Display dashboard
-                self.display_header()
-                self.display_test_status()
-                self.display_performance_metrics()
-                self.display_log_summary()
-                self.display_quick_actions()
-                
-                colored_print(f"🔄 Auto-refresh in {refresh_interval}s (Ctrl+C to exit)", Colors.YELLOW)
+                self.render(footer=f"🔄 Auto-refresh in {refresh_interval}s (Ctrl+C to exit)")
                 
                 # Wait for refresh interval
                 time.sleep(refresh_interval)
@@ -354,11 +381,25 @@ class CIMonitor:
     
     def run_once(self):
         """Run dashboard once (no auto-refresh)."""
-        self.display_header()
-        self.display_test_status()
-        self.display_performance_metrics()
-        self.display_log_summary()
-        self.display_quick_actions()
+        self.render()
+    
+    def render(self, footer=None):
+        """Render every dashboard section and emit it with a single write."""
+        # Gather test status once; both the status and performance panels use it
+        status = self.get_test_status()
+        
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            self.display_header()
+            self.display_test_status(status)
+            self.display_performance_metrics(status)
+            self.display_log_summary()
+            self.display_quick_actions()
+            if footer:
+                colored_print(footer, Colors.YELLOW)
+        
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
 
 def main():
     """Main function."""
@@ -393,10 +434,8 @@ Examples:
     
     # Run dashboard
     if args.watch:
-        colored_print("🚀 Starting CI/CD Dashboard (auto-refresh mode)", Colors.BOLD + Colors.GREEN)
-        print("Press Ctrl+C to exit")
-        print()
-        time.sleep(2)
+        # The first refresh clears the screen straight away and its footer
+        # already carries the Ctrl+C hint, so start rendering immediately
         monitor.run_dashboard(args.interval)
     else:
         monitor.run_once()
@@ -27,11 +27,22 @@ VERBOSE=false
 CLEAN=false
 PARALLEL=true
 
-# Function to print colored output
+# Timestamp for log lines: use the printf builtin where available (bash >= 4.2)
+# so each message does not fork a date process
+if (( BASH_VERSINFO[0] > 4 || (BASH_VERSINFO[0] == 4 && BASH_VERSINFO[1] >= 2) )); then
+    timestamp() { printf -v TIMESTAMP '%(%H:%M:%S)T' -1; }
+else
+    timestamp() { TIMESTAMP=$(date '+%H:%M:%S'); }
+fi
+
+# Function to print colored output (to the terminal and the log, without a tee pipeline)
 print_status() {
     local color=$1
     local message=$2
-    echo -e "${color}[$(date '+%H:%M:%S')] ${message}${NC}" | tee -a "$LOG_FILE"
+    timestamp
+    local line="${color}[${TIMESTAMP}] ${message}${NC}"
+    echo -e "$line"
+    echo -e "$line" >> "$LOG_FILE"
 }
 
 print_info() { print_status "$BLUE" "INFO: $1"; }
@@ -192,8 +203,9 @@ start_time=$(date +%s)
 case $TEST_SUITE in
     all)
         if [ "$PARALLEL" = true ]; then
-            print_info "Running complete test suite in parallel..."
-            if ! make test_all SIM="$SIM" >> "$LOG_FILE" 2>&1; then
+            num_jobs=$(nproc 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 2)
+            print_info "Running complete test suite in parallel ($num_jobs jobs)..."
+            if ! make -j "$num_jobs" test_all SIM="$SIM" >> "$LOG_FILE" 2>&1; then
                 print_error "Test suite failed. Check $LOG_FILE for details."
                 exit 1
             fi
@@ -21,6 +21,11 @@ YELLOW='\033[1;33m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
+# Drop escape codes when output is redirected to a file or pipe
+if [ ! -t 1 ]; then
+    RED='' GREEN='' YELLOW='' BLUE='' NC=''
+fi
+
 # Script directory
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/../../.." && pwd)"
@@ -54,16 +59,16 @@ check_python() {
         PYTHON_VERSION=$(python3 --version 2>&1 | cut -d" " -f2)
         print_status "Python 3 found: $PYTHON_VERSION"
         
-        # Check if version is >= 3.8
-        REQUIRED_VERSION="3.8"
-        if python3 -c "import sys; exit(0 if sys.version_info >= (3,8) else 1)" 2>/dev/null; then
-            print_status "Python version is compatible (>= 3.8)"
+        # Check if version is >= 3.9
+        REQUIRED_VERSION="3.9"
+        if python3 -c "import sys; exit(0 if sys.version_info >= (3,9) else 1)" 2>/dev/null; then
+            print_status "Python version is compatible (>= 3.9)"
         else
-            print_error "Python 3.8+ required, found $PYTHON_VERSION"
+            print_error "Python 3.9+ required, found $PYTHON_VERSION"
             exit 1
         fi
     else
-        print_error "Python 3 not found. Please install Python 3.8 or later."
+        print_error "Python 3 not found. Please install Python 3.9 or later."
         exit 1
     fi
 }
@@ -83,15 +83,18 @@ module tb_filter_rx_pipeline;
         m_axis_tready = 1'b1;  // Always ready for output
     end
     
-    // Dump waves for debugging
+    // Dump waves for debugging (+dumpfile=<path> overrides the file name)
     initial begin
+        string dumpfile_name;
+        if (!$value$plusargs("dumpfile=%s", dumpfile_name))
+            dumpfile_name = "filter_rx_pipeline.vcd";
         `ifdef VERILATOR
             if ($test$plusargs("trace")) begin
-                $dumpfile("filter_rx_pipeline.vcd");
+                $dumpfile(dumpfile_name);
                 $dumpvars(0, tb_filter_rx_pipeline);
             end
         `else
-            $dumpfile("filter_rx_pipeline.vcd");
+            $dumpfile(dumpfile_name);
             $dumpvars(0, tb_filter_rx_pipeline);
         `endif
     end
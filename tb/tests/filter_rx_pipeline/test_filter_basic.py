@@ -34,16 +34,26 @@ try:
 except ImportError:
     DEBUGPY_AVAILABLE = False
 
+# Debugger port from the environment, resolved once at import
+# (None unless COCOTB_DEBUG is set)
+DEBUG_PORT = None
+if os.environ.get('COCOTB_DEBUG'):
+    try:
+        DEBUG_PORT = int(os.environ.get('COCOTB_DEBUG_PORT', '5678'))
+    except ValueError:
+        # A bad port must not stop the whole module from loading
+        cocotb.log.warning("Invalid COCOTB_DEBUG_PORT, using default port 5678")
+        DEBUG_PORT = 5678
+
 
 @cocotb.test()
 async def test_clock_and_reset(dut):
     """Test basic clock and reset functionality - ensures time progresses"""
     
     # Start debugpy if available and environment variable is set
-    if DEBUGPY_AVAILABLE and os.environ.get('COCOTB_DEBUG'):
-        debug_port = int(os.environ.get('COCOTB_DEBUG_PORT', '5678'))
-        debugpy.listen(('localhost', debug_port))
-        print(f"Waiting for debugger on port {debug_port}...")
+    if DEBUGPY_AVAILABLE and DEBUG_PORT is not None:
+        debugpy.listen(('localhost', DEBUG_PORT))
+        print(f"Waiting for debugger on port {DEBUG_PORT}...")
         debugpy.wait_for_client()
         print("Debugger attached!")
     
@@ -134,7 +144,7 @@ async def run_random_packets(dut, num_packets=10):
     
     for i in range(num_packets):
         # Random packet data
-        packet_data = random.randint(0, 2**64 - 1)
+        packet_data = random.getrandbits(64)
         packet_keep = random.randint(1, 0xFF)
         
         dut.s_axis_tdata.value = packet_data
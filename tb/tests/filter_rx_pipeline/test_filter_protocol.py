@@ -355,7 +355,7 @@ class ProtocolTestSuite:
         for i in range(num_packets):
             # Generate random payload
             payload_size = random.randint(50, 1000)
-            payload = bytes([random.randint(0, 255) for _ in range(payload_size)])
+            payload = random.randbytes(payload_size)
             
             packet_data = self.packet_gen.generate_ipv4_packet(
                 src_ip="192.168.1.1", dst_ip="10.0.0.1",
@@ -387,7 +387,7 @@ class ProtocolTestSuite:
         # Generate variety of packet sizes and patterns
         for i in range(packets_to_send):
             payload_size = random.randint(60, 1500)
-            payload = bytes([random.randint(0, 255) for _ in range(payload_size)])
+            payload = random.randbytes(payload_size)
             
             packet_data = self.packet_gen.generate_ipv4_packet(
                 src_ip="192.168.1.1", dst_ip="10.0.0.1",
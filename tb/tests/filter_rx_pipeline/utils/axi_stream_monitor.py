@@ -4,9 +4,10 @@ Monitors both input and output AXI Stream interfaces.
 """
 
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.triggers import RisingEdge, FallingEdge, ClockCycles, Event, First
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
+import logging
 import time
 
 
@@ -47,7 +48,7 @@ class AxiStreamPacket:
     @property
     def data_bytes(self) -> bytes:
         """Extract packet data as bytes."""
-        data = b''
+        chunks = []
         bytes_per_beat = 64  # 512 bits / 8
         
         for beat in self.beats:
@@ -57,11 +58,12 @@ class AxiStreamPacket:
             if beat.tlast:
                 # Only include valid bytes in final beat
                 valid_bytes = bin(beat.tkeep).count('1')
-                data += beat_bytes[:valid_bytes]
+                chunks.append(beat_bytes[:valid_bytes])
             else:
-                data += beat_bytes
+                chunks.append(beat_bytes)
                 
-        return data
+        # Join once rather than re-copying the packet on every beat
+        return b''.join(chunks)
 
 
 class AxiStreamMonitor:
@@ -83,6 +85,14 @@ class AxiStreamMonitor:
         self.name = interface_name
         self.signals = signals
         
+        # Resolve signal handles once rather than on every sampled cycle
+        self.tvalid = signals['tvalid']
+        self.tready = signals['tready']
+        self.tdata = signals['tdata']
+        self.tkeep = signals['tkeep']
+        self.tlast = signals['tlast']
+        self.tuser = signals['tuser']
+        
         # Monitoring state
         self.packets: List[AxiStreamPacket] = []
         self.current_packet: Optional[AxiStreamPacket] = None
@@ -99,6 +109,9 @@ class AxiStreamMonitor:
         # Control
         self.monitoring = False
         
+        # Set whenever a packet completes, so waiters need not poll every cycle
+        self._packet_event = Event()
+        
     def add_packet_callback(self, callback: Callable[[AxiStreamPacket], None]):
         """Add callback to be called when packet is complete."""
         self.packet_callbacks.append(callback)
@@ -126,16 +139,16 @@ class AxiStreamMonitor:
             await RisingEdge(self.clock)
             
             # Read current signal values
-            tvalid = bool(self.signals['tvalid'].value)
-            tready = bool(self.signals['tready'].value)
+            tvalid = bool(self.tvalid.value)
+            tready = bool(self.tready.value)
             
             if tvalid and tready:
                 # Valid transaction
                 beat = AxiStreamBeat(
-                    tdata=int(self.signals['tdata'].value),
-                    tkeep=int(self.signals['tkeep'].value),
-                    tlast=bool(self.signals['tlast'].value),
-                    tuser=int(self.signals['tuser'].value),
+                    tdata=int(self.tdata.value),
+                    tkeep=int(self.tkeep.value),
+                    tlast=bool(self.tlast.value),
+                    tuser=int(self.tuser.value),
                     tvalid=tvalid,
                     tready=tready,
                     timestamp=time.time()
@@ -169,6 +182,7 @@ class AxiStreamMonitor:
             self.current_packet.end_time = beat.timestamp
             self.packets.append(self.current_packet)
             self.total_packets += 1
+            self._packet_event.set()
             
             # Call packet callbacks
             for callback in self.packet_callbacks:
@@ -177,8 +191,10 @@ class AxiStreamMonitor:
                 except Exception as e:
                     cocotb.log.error(f"Packet callback error: {e}")
                     
-            cocotb.log.debug(f"{self.name}: Completed packet #{self.total_packets}, "
-                           f"size={self.current_packet.size_bytes} bytes")
+            # size_bytes walks every beat, so only compute it when it is logged
+            if cocotb.log.isEnabledFor(logging.DEBUG):
+                cocotb.log.debug("%s: Completed packet #%d, size=%d bytes",
+                                 self.name, self.total_packets, self.current_packet.size_bytes)
             
             self.current_packet = None
             
@@ -226,11 +242,12 @@ class AxiStreamMonitor:
         initial_count = self.total_packets
         
         async def _wait():
-            for _ in range(timeout_cycles):
-                await RisingEdge(self.clock)
-                if self.total_packets > initial_count:
-                    return self.packets[-1]
-            raise TimeoutError(f"No packet received within {timeout_cycles} cycles")
+            if self.total_packets == initial_count:
+                self._packet_event.clear()
+                await First(self._packet_event.wait(), ClockCycles(self.clock, timeout_cycles))
+                if self.total_packets == initial_count:
+                    raise TimeoutError(f"No packet received within {timeout_cycles} cycles")
+            return self.packets[-1]
             
         return cocotb.start_soon(_wait())
         
@@ -249,13 +266,19 @@ class AxiStreamMonitor:
             
         if expected_packet != received_data:
             cocotb.log.error("Packet data mismatch")
-            # Log first few differing bytes for debugging
-            for i, (exp, rcv) in enumerate(zip(expected_packet, received_data)):
-                if exp != rcv:
-                    cocotb.log.error(f"Byte {i}: expected 0x{exp:02x}, received 0x{rcv:02x}")
-                    if i >= 10:  # Limit output
-                        cocotb.log.error("... (more differences)")
-                        break
+            # Log first few differing bytes for debugging; this only runs on
+            # failure, so a passing comparison never formats any hex
+            diffs = [i for i, (exp, rcv) in enumerate(zip(expected_packet, received_data)) if exp != rcv]
+            first = diffs[0]
+            window = slice(first - first % 16, first - first % 16 + 16)
+            cocotb.log.error(f"First difference at byte {first}: "
+                           f"expected {expected_packet[window].hex(' ')}, "
+                           f"received {received_data[window].hex(' ')}")
+            for i in diffs[:10]:  # Limit output
+                cocotb.log.error(f"Byte {i}: expected 0x{expected_packet[i]:02x}, "
+                               f"received 0x{received_data[i]:02x}")
+            if len(diffs) > 10:
+                cocotb.log.error(f"... ({len(diffs) - 10} more differences)")
             return False
             
         return True
@@ -278,12 +301,20 @@ class AxiStreamDriver:
         self.clock = clock
         self.signals = signals
         
+        # Resolve signal handles once rather than on every driven beat
+        self.tvalid = signals['tvalid']
+        self.tready = signals['tready']
+        self.tdata = signals['tdata']
+        self.tkeep = signals['tkeep']
+        self.tlast = signals['tlast']
+        self.tuser = signals['tuser']
+        
         # Initialize signals
-        self.signals['tvalid'].value = 0
-        self.signals['tdata'].value = 0
-        self.signals['tkeep'].value = 0
-        self.signals['tlast'].value = 0
-        self.signals['tuser'].value = 0
+        self.tvalid.value = 0
+        self.tdata.value = 0
+        self.tkeep.value = 0
+        self.tlast.value = 0
+        self.tuser.value = 0
         
     async def send_packet(self, packet_beats: List[tuple], inter_beat_delay: int = 0):
         """
@@ -293,41 +324,40 @@ class AxiStreamDriver:
             packet_beats: List of (tdata, tkeep, tlast, tuser) tuples
             inter_beat_delay: Clock cycles to wait between beats
         """
+        last_index = len(packet_beats) - 1
+        
         for i, (tdata, tkeep, tlast, tuser) in enumerate(packet_beats):
-            # Wait for ready
-            await self._wait_for_ready()
-            
-            # Drive signals
-            self.signals['tvalid'].value = 1
-            self.signals['tdata'].value = tdata
-            self.signals['tkeep'].value = tkeep
-            self.signals['tlast'].value = int(tlast)
-            self.signals['tuser'].value = tuser
+            # Present the beat; tvalid stays high across back-to-back beats
+            self.tvalid.value = 1
+            self.tdata.value = tdata
+            self.tkeep.value = tkeep
+            self.tlast.value = int(tlast)
+            self.tuser.value = tuser
             
-            # Wait for clock edge
-            await RisingEdge(self.clock)
+            # The beat transfers on the first edge that sees tready high
+            await self._wait_for_ready()
             
             # Add inter-beat delay if specified
-            if inter_beat_delay > 0 and i < len(packet_beats) - 1:
-                self.signals['tvalid'].value = 0
+            if inter_beat_delay > 0 and i < last_index:
+                self.tvalid.value = 0
                 for _ in range(inter_beat_delay):
                     await RisingEdge(self.clock)
                     
         # Deassert tvalid after packet
-        self.signals['tvalid'].value = 0
-        self.signals['tlast'].value = 0
+        self.tvalid.value = 0
+        self.tlast.value = 0
         
     async def _wait_for_ready(self, timeout_cycles: int = 1000):
         """Wait for tready to be asserted."""
         for _ in range(timeout_cycles):
             await RisingEdge(self.clock)
-            if bool(self.signals['tready'].value):
+            if bool(self.tready.value):
                 return
         raise TimeoutError("tready not asserted within timeout")
         
     async def send_idle_cycles(self, cycles: int):
         """Send idle cycles (tvalid=0)."""
-        self.signals['tvalid'].value = 0
+        self.tvalid.value = 0
         for _ in range(cycles):
             await RisingEdge(self.clock)
             
@@ -335,5 +365,5 @@ class AxiStreamDriver:
         """Apply backpressure pattern to tready (for monitor-side)."""
         # This would be used on the output side to simulate downstream backpressure
         for ready_val in pattern:
-            self.signals['tready'].value = int(ready_val)
+            self.tready.value = int(ready_val)
             await RisingEdge(self.clock)
@@ -17,6 +17,10 @@ except ImportError:
     raise
 
 
+# One period of the "increment" payload pattern; longer payloads repeat it
+_INCREMENT_PATTERN = bytes(range(256))
+
+
 @dataclass
 class PacketConfig:
     """Configuration for packet generation."""
@@ -36,11 +40,41 @@ class PacketConfig:
     truncate_at: Optional[int] = None  # Truncate packet at this byte position
 
 
+def _packet_to_beats(packet: bytes, bytes_per_beat: int) -> List[Tuple[int, int, bool, int]]:
+    """
+    Split a packet into (tdata, tkeep, tlast, tuser) AXI Stream beats.
+    
+    Beats are little-endian, so a short final beat needs no zero padding
+    before conversion: the missing high bytes are already zero.
+    """
+    packet_len = len(packet)
+    last_start = max(packet_len - 1, 0) // bytes_per_beat * bytes_per_beat
+    full_keep = (1 << bytes_per_beat) - 1
+    from_bytes = int.from_bytes
+    
+    # Every beat but the last is full width; tuser is unused (0)
+    beats = [(from_bytes(packet[i:i + bytes_per_beat], 'little'), full_keep, False, 0)
+             for i in range(0, last_start, bytes_per_beat)]
+    
+    if packet_len:
+        tail = packet[last_start:]
+        beats.append((from_bytes(tail, 'little'), (1 << len(tail)) - 1, True, 0))
+        
+    return beats
+
+
 class PacketGenerator:
     """Generates network packets for testing using Scapy."""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """Initialize generator.
+        
+        Args:
+            seed: Seed for the "random" payload pattern, for reproducible runs;
+                defaults to a draw from the global generator (cocotb's RANDOM_SEED)
+        """
         self.sequence_number = 0
+        self._rng = random.Random(random.getrandbits(64) if seed is None else seed)
         
     def generate_payload(self, config: PacketConfig) -> bytes:
         """Generate packet payload."""
@@ -51,9 +85,10 @@ class PacketGenerator:
             return config.custom_payload[:config.payload_size]
             
         if config.payload_pattern == "increment":
-            return bytes(i % 256 for i in range(config.payload_size))
+            repeats = config.payload_size // len(_INCREMENT_PATTERN) + 1
+            return (_INCREMENT_PATTERN * repeats)[:config.payload_size]
         elif config.payload_pattern == "random":
-            return bytes(random.randint(0, 255) for _ in range(config.payload_size))
+            return self._rng.randbytes(config.payload_size)
         elif config.payload_pattern == "fixed":
             return b'\xAA' * config.payload_size
         else:
@@ -115,32 +150,7 @@ class PacketGenerator:
         Returns:
             List of (tdata, tkeep, tlast, tuser) tuples
         """
-        bytes_per_beat = data_width // 8
-        beats = []
-        
-        for i in range(0, len(packet), bytes_per_beat):
-            beat_data = packet[i:i + bytes_per_beat]
-            
-            # Pad beat to full width
-            if len(beat_data) < bytes_per_beat:
-                beat_data += b'\x00' * (bytes_per_beat - len(beat_data))
-                
-            # Convert to integer (little-endian for AXI Stream)
-            tdata = int.from_bytes(beat_data, byteorder='little')
-            
-            # Generate tkeep - 1 bit per byte, only for valid bytes
-            valid_bytes = min(len(packet) - i, bytes_per_beat)
-            tkeep = (1 << valid_bytes) - 1
-            
-            # tlast on final beat
-            tlast = (i + bytes_per_beat >= len(packet))
-            
-            # tuser - can be used for metadata (keeping as 0 for now)
-            tuser = 0
-            
-            beats.append((tdata, tkeep, tlast, tuser))
-            
-        return beats
+        return _packet_to_beats(packet, data_width // 8)
         
     def create_packet_summary(self, config: PacketConfig) -> str:
         """Create a human-readable summary of the packet configuration."""
@@ -384,48 +394,75 @@ def print_packet_info(packet_bytes: bytes, description: str = ""):
 
 
 # Utility functions for common test patterns
-def create_test_scenario_packets() -> dict:
-    """Create packets for various test scenarios."""
-    scenarios = {}
-    
-    # Basic IPv4 filtering test packets
-    scenarios['ipv4_basic'] = [
+def _ipv4_basic_packets() -> List[PacketConfig]:
+    """Basic IPv4 filtering test packets."""
+    return [
         TestPackets.ipv4_http_packet("192.168.1.1"),      # Should match Rule 0
         TestPackets.ipv4_https_packet("192.168.1.2"),     # Should match Rule 1  
         TestPackets.ipv4_http_packet("192.168.1.3"),      # Should not match
         PacketConfig(ip_version=4, dst_ip="192.168.1.1", dst_port=8080)  # Wrong port
     ]
-    
-    # Basic IPv6 filtering test packets
-    scenarios['ipv6_basic'] = [
+
+
+def _ipv6_basic_packets() -> List[PacketConfig]:
+    """Basic IPv6 filtering test packets."""
+    return [
         TestPackets.ipv6_http_packet("2001:db8::1"),      # Should match Rule 0
         TestPackets.ipv6_https_packet("2001:db8::2"),     # Should match Rule 1
         TestPackets.ipv6_http_packet("2001:db8::3"),      # Should not match
     ]
-    
-    # Mixed protocol packets
-    scenarios['mixed_protocol'] = [
+
+
+def _mixed_protocol_packets() -> List[PacketConfig]:
+    """Mixed protocol packets."""
+    return [
         TestPackets.ipv4_http_packet("192.168.1.1"),
         TestPackets.ipv6_https_packet("2001:db8::1"),
         TestPackets.ipv4_https_packet("192.168.1.2"),
         TestPackets.ipv6_http_packet("2001:db8::2"),
     ]
-    
-    # Edge case packets
-    scenarios['edge_cases'] = [
+
+
+def _edge_case_packets() -> List[PacketConfig]:
+    """Edge case packets."""
+    return [
         TestPackets.malformed_ethertype_packet(),
         TestPackets.truncated_packet(),
         TestPackets.jumbo_frame_packet(),
         PacketConfig(ip_version=4, dst_ip="192.168.1.1", payload_size=0),  # Minimum size
     ]
-    
-    # Performance test packets
-    scenarios['performance'] = [
+
+
+def _performance_packets() -> List[PacketConfig]:
+    """Performance test packets."""
+    return [
         PacketConfig(ip_version=4, dst_ip="192.168.1.1", dst_port=80, payload_size=size)
         for size in [64, 128, 256, 512, 1500]
     ]
-    
-    return scenarios
+
+
+# (ip_version, dst_ip, dst_port) flows matched by the default filter rules
+_DEFAULT_RULE_FLOWS = frozenset({
+    (4, "192.168.1.1", 80),
+    (4, "192.168.1.2", 443),
+    (6, "2001:db8::1", 80),
+    (6, "2001:db8::2", 443),
+})
+
+
+# Scenario name -> builder, so a single scenario can be created on its own
+_SCENARIO_BUILDERS = {
+    'ipv4_basic': _ipv4_basic_packets,
+    'ipv6_basic': _ipv6_basic_packets,
+    'mixed_protocol': _mixed_protocol_packets,
+    'edge_cases': _edge_case_packets,
+    'performance': _performance_packets,
+}
+
+
+def create_test_scenario_packets() -> dict:
+    """Create packets for various test scenarios."""
+    return {name: build() for name, build in _SCENARIO_BUILDERS.items()}
 
 
 class ScapyPacketGenerator:
@@ -458,7 +495,7 @@ class ScapyPacketGenerator:
         Returns:
             List of (tdata, tkeep, tlast, tuser) tuples
         """
-        config = PacketConfig(
+        return self._generate_beats(
             ip_version=4,
             src_ip=src_ip,
             dst_ip=dst_ip,
@@ -468,9 +505,6 @@ class ScapyPacketGenerator:
             payload_size=payload_size
         )
         
-        packet = self.packet_gen.generate_packet(config)
-        return self._packet_to_axi_stream(packet)
-        
     def generate_ipv6_packet(self, src_ip: str, dst_ip: str, src_port: int, dst_port: int,
                            payload_size: int = 0, protocol: str = "UDP") -> List[Tuple[int, int, bool, int]]:
         """
@@ -487,7 +521,7 @@ class ScapyPacketGenerator:
         Returns:
             List of (tdata, tkeep, tlast, tuser) tuples
         """
-        config = PacketConfig(
+        return self._generate_beats(
             ip_version=6,
             src_ip=src_ip,
             dst_ip=dst_ip,
@@ -497,13 +531,10 @@ class ScapyPacketGenerator:
             payload_size=payload_size
         )
         
-        packet = self.packet_gen.generate_packet(config)
-        return self._packet_to_axi_stream(packet)
-        
     def generate_tcp_packet(self, src_ip: str, dst_ip: str, src_port: int, dst_port: int,
                           payload_size: int = 0, ip_version: int = 4) -> List[Tuple[int, int, bool, int]]:
         """Generate a TCP packet as AXI Stream beats."""
-        config = PacketConfig(
+        return self._generate_beats(
             ip_version=ip_version,
             src_ip=src_ip,
             dst_ip=dst_ip,
@@ -513,13 +544,10 @@ class ScapyPacketGenerator:
             payload_size=payload_size
         )
         
-        packet = self.packet_gen.generate_packet(config)
-        return self._packet_to_axi_stream(packet)
-        
     def generate_udp_packet(self, src_ip: str, dst_ip: str, src_port: int, dst_port: int,
                           payload_size: int = 0, ip_version: int = 4) -> List[Tuple[int, int, bool, int]]:
         """Generate a UDP packet as AXI Stream beats."""
-        config = PacketConfig(
+        return self._generate_beats(
             ip_version=ip_version,
             src_ip=src_ip,
             dst_ip=dst_ip,
@@ -529,14 +557,16 @@ class ScapyPacketGenerator:
             payload_size=payload_size
         )
         
-        packet = self.packet_gen.generate_packet(config)
-        return self._packet_to_axi_stream(packet)
-        
     def generate_malformed_packet(self, config: PacketConfig) -> List[Tuple[int, int, bool, int]]:
         """Generate a malformed packet for edge case testing."""
         packet = self.packet_gen.generate_packet(config)
         return self._packet_to_axi_stream(packet)
         
+    def _generate_beats(self, **fields) -> List[Tuple[int, int, bool, int]]:
+        """Build a packet from PacketConfig fields and return it as AXI Stream beats."""
+        packet = self.packet_gen.generate_packet(PacketConfig(**fields))
+        return self._packet_to_axi_stream(packet)
+        
     def _packet_to_axi_stream(self, packet: bytes) -> List[Tuple[int, int, bool, int]]:
         """
         Convert a packet byte array to AXI Stream beats.
@@ -547,33 +577,7 @@ class ScapyPacketGenerator:
         Returns:
             List of (tdata, tkeep, tlast, tuser) tuples
         """
-        beats = []
-        packet_len = len(packet)
-        
-        for i in range(0, packet_len, self.data_bytes):
-            # Extract data for this beat
-            beat_data = packet[i:i + self.data_bytes]
-            bytes_in_beat = len(beat_data)
-            
-            # Pad to full width if needed
-            if bytes_in_beat < self.data_bytes:
-                beat_data += b'\x00' * (self.data_bytes - bytes_in_beat)
-                
-            # Convert to integer (little endian)
-            tdata = int.from_bytes(beat_data, byteorder='little')
-            
-            # Create tkeep mask (1 bit per valid byte)
-            tkeep = (1 << bytes_in_beat) - 1
-            
-            # Set tlast on final beat
-            tlast = (i + self.data_bytes >= packet_len)
-            
-            # tuser can carry additional metadata (set to 0 for now)
-            tuser = 0
-            
-            beats.append((tdata, tkeep, tlast, tuser))
-            
-        return beats
+        return _packet_to_beats(packet, self.data_bytes)
         
     def create_test_scenario(self, scenario_name: str) -> List[Tuple[PacketConfig, bool]]:
         """
@@ -585,18 +589,14 @@ class ScapyPacketGenerator:
         Returns:
             List of (packet_config, should_match) tuples
         """
-        scenarios = create_test_scenario_packets()
-        
-        if scenario_name not in scenarios:
+        build = _SCENARIO_BUILDERS.get(scenario_name)
+        if build is None:
             raise ValueError(f"Unknown scenario: {scenario_name}")
             
-        test_packets = []
-        for config in scenarios[scenario_name]:
-            # Determine if packet should match based on dst_ip and dst_port
-            should_match = self._packet_should_match(config)
-            test_packets.append((config, should_match))
-            
-        return test_packets
+        # Pair each config with its expected outcome (based on dst_ip and dst_port)
+        # in the same pass that walks the scenario
+        should_match = self._packet_should_match
+        return [(config, should_match(config)) for config in build()]
         
     def _packet_should_match(self, config: PacketConfig) -> bool:
         """
@@ -606,11 +606,4 @@ class ScapyPacketGenerator:
         - Rule 0: IPv4 192.168.1.1:80 or IPv6 2001:db8::1:80
         - Rule 1: IPv4 192.168.1.2:443 or IPv6 2001:db8::2:443
         """
-        if config.ip_version == 4:
-            return ((config.dst_ip == "192.168.1.1" and config.dst_port == 80) or
-                    (config.dst_ip == "192.168.1.2" and config.dst_port == 443))
-        elif config.ip_version == 6:
-            return ((config.dst_ip == "2001:db8::1" and config.dst_port == 80) or
-                    (config.dst_ip == "2001:db8::2" and config.dst_port == 443))
-        else:
-            return False
+        return (config.ip_version, config.dst_ip, config.dst_port) in _DEFAULT_RULE_FLOWS
@@ -7,9 +7,26 @@ import cocotb
 from cocotb.triggers import RisingEdge
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
+import struct
 import time
 
 
+# Counter fields shared by ExpectedStats and ActualStats, in status register order
+COUNTER_FIELDS = ('total_packets', 'dropped_packets', 'rule0_hit_count', 'rule1_hit_count')
+
+# Four little-endian 32-bit counters packed into the low 128 bits of status_reg
+_STATUS_COUNTERS = struct.Struct('<4I')
+_STATUS_COUNTERS_MASK = (1 << (8 * _STATUS_COUNTERS.size)) - 1
+
+# Short counter names accepted by verify_counter_increment, mapped to their fields
+COUNTER_NAME_FIELDS = {
+    'total': 'total_packets',
+    'dropped': 'dropped_packets',
+    'rule0': 'rule0_hit_count',
+    'rule1': 'rule1_hit_count',
+}
+
+
 @dataclass
 class ExpectedStats:
     """Expected statistics values."""
@@ -37,10 +54,10 @@ class ActualStats:
         # [95:64]  - rule0_hit_count
         # [127:96] - rule1_hit_count
         
-        total_packets = (status_reg_value >> 0) & 0xFFFFFFFF
-        dropped_packets = (status_reg_value >> 32) & 0xFFFFFFFF
-        rule0_hit_count = (status_reg_value >> 64) & 0xFFFFFFFF
-        rule1_hit_count = (status_reg_value >> 96) & 0xFFFFFFFF
+        # Split all four counters in one unpack instead of four shift/mask pairs
+        total_packets, dropped_packets, rule0_hit_count, rule1_hit_count = _STATUS_COUNTERS.unpack(
+            (status_reg_value & _STATUS_COUNTERS_MASK).to_bytes(_STATUS_COUNTERS.size, 'little')
+        )
         
         return cls(
             total_packets=total_packets,
@@ -150,6 +167,9 @@ class StatisticsChecker:
         self.dut = dut
         self.clock = clock
         
+        # Resolve the counter register handle once; it is read on every check
+        self._status_reg = dut.status_reg
+        
         # Statistics tracking
         self.expected = ExpectedStats()
         self.last_actual = ActualStats()
@@ -164,16 +184,15 @@ class StatisticsChecker:
         await RisingEdge(self.clock)  # Ensure we read on clock edge
         
         # Read status register
-        status_reg_value = int(self.dut.status_reg.value)
+        status_reg_value = int(self._status_reg.value)
         actual = ActualStats.from_status_reg(status_reg_value)
         
         self.last_actual = actual
         self.history.append(actual)
         
-        cocotb.log.debug(f"Read stats: total={actual.total_packets}, "
-                        f"dropped={actual.dropped_packets}, "
-                        f"rule0={actual.rule0_hit_count}, "
-                        f"rule1={actual.rule1_hit_count}")
+        cocotb.log.debug("Read stats: total=%d, dropped=%d, rule0=%d, rule1=%d",
+                         actual.total_packets, actual.dropped_packets,
+                         actual.rule0_hit_count, actual.rule1_hit_count)
         
         return actual
         
@@ -191,10 +210,9 @@ class StatisticsChecker:
             # Packet processed but no rule hit specified - assume it was dropped
             self.expected.dropped_packets += 1
             
-        cocotb.log.debug(f"Expected stats updated: total={self.expected.total_packets}, "
-                        f"dropped={self.expected.dropped_packets}, "
-                        f"rule0={self.expected.rule0_hit_count}, "
-                        f"rule1={self.expected.rule1_hit_count}")
+        cocotb.log.debug("Expected stats updated: total=%d, dropped=%d, rule0=%d, rule1=%d",
+                         self.expected.total_packets, self.expected.dropped_packets,
+                         self.expected.rule0_hit_count, self.expected.rule1_hit_count)
         
     async def verify_stats(self, tolerance_cycles: int = 10) -> bool:
         """
@@ -212,24 +230,17 @@ class StatisticsChecker:
             
         actual = await self.read_current_stats()
         
-        # Check each counter
-        mismatches = []
+        # Check each counter; messages are only formatted for counters that differ
+        expected_values = [getattr(self.expected, field) for field in COUNTER_FIELDS]
+        actual_values = [getattr(actual, field) for field in COUNTER_FIELDS]
         
-        if actual.total_packets != self.expected.total_packets:
-            mismatches.append(f"total_packets: expected {self.expected.total_packets}, "
-                            f"actual {actual.total_packets}")
-            
-        if actual.dropped_packets != self.expected.dropped_packets:
-            mismatches.append(f"dropped_packets: expected {self.expected.dropped_packets}, "
-                            f"actual {actual.dropped_packets}")
-            
-        if actual.rule0_hit_count != self.expected.rule0_hit_count:
-            mismatches.append(f"rule0_hit_count: expected {self.expected.rule0_hit_count}, "
-                            f"actual {actual.rule0_hit_count}")
-            
-        if actual.rule1_hit_count != self.expected.rule1_hit_count:
-            mismatches.append(f"rule1_hit_count: expected {self.expected.rule1_hit_count}, "
-                            f"actual {actual.rule1_hit_count}")
+        mismatches = []
+        if expected_values != actual_values:
+            mismatches = [
+                f"{field}: expected {exp}, actual {act}"
+                for field, exp, act in zip(COUNTER_FIELDS, expected_values, actual_values)
+                if exp != act
+            ]
             
         # Check consistency - total should equal sum of hits and drops
         expected_total = self.expected.rule0_hit_count + self.expected.rule1_hit_count + self.expected.dropped_packets
@@ -250,9 +261,8 @@ class StatisticsChecker:
         if self.last_check_passed:
             cocotb.log.info("Statistics verification PASSED")
         else:
-            cocotb.log.error("Statistics verification FAILED:")
-            for mismatch in mismatches:
-                cocotb.log.error(f"  - {mismatch}")
+            cocotb.log.error("Statistics verification FAILED:\n" +
+                             "\n".join(f"  - {mismatch}" for mismatch in mismatches))
                 
         return self.last_check_passed
         
@@ -370,6 +380,11 @@ class StatisticsChecker:
         Returns:
             True if increment matches expectation
         """
+        field = COUNTER_NAME_FIELDS.get(counter_name)
+        if field is None:
+            cocotb.log.error(f"Unknown counter name: {counter_name}")
+            return False
+            
         # Read initial value
         initial = await self.read_current_stats()
         
@@ -378,17 +393,7 @@ class StatisticsChecker:
         final = await self.read_current_stats()
         
         # Calculate actual increment
-        if counter_name == 'total':
-            actual_increment = final.total_packets - initial.total_packets
-        elif counter_name == 'dropped':
-            actual_increment = final.dropped_packets - initial.dropped_packets
-        elif counter_name == 'rule0':
-            actual_increment = final.rule0_hit_count - initial.rule0_hit_count
-        elif counter_name == 'rule1':
-            actual_increment = final.rule1_hit_count - initial.rule1_hit_count
-        else:
-            cocotb.log.error(f"Unknown counter name: {counter_name}")
-            return False
+        actual_increment = getattr(final, field) - getattr(initial, field)
             
         success = actual_increment == expected_increment
         
@@ -7,10 +7,17 @@ import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, ClockCycles, Timer
 from cocotb.types import LogicArray
+import ipaddress
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Layout of one rule in cfg_reg: [IPv6_addr(128) | IPv4_addr(32) | Port(32)]
+RULE_WIDTH = 192
+IPV6_ADDR_MASK = (1 << 128) - 1
+IPV4_ADDR_MASK = (1 << 32) - 1
+PORT_MASK = (1 << 32) - 1
+
 
 class FilterRxTestbench:
     """Main testbench class for filter_rx_pipeline tests."""
@@ -84,16 +91,16 @@ class FilterRxTestbench:
             rule_value = 0
             
             if "ipv6_addr" in rule_config:
-                rule_value |= (rule_config["ipv6_addr"] & ((1 << 128) - 1)) << 64
+                rule_value |= (rule_config["ipv6_addr"] & IPV6_ADDR_MASK) << 64
                 
             if "ipv4_addr" in rule_config:
-                rule_value |= (rule_config["ipv4_addr"] & ((1 << 32) - 1)) << 32
+                rule_value |= (rule_config["ipv4_addr"] & IPV4_ADDR_MASK) << 32
                 
             if "port" in rule_config:
-                rule_value |= (rule_config["port"] & ((1 << 32) - 1))
+                rule_value |= (rule_config["port"] & PORT_MASK)
                 
             # Shift rule value to correct position in config register
-            cfg_value |= rule_value << (rule_idx * 192)
+            cfg_value |= rule_value << (rule_idx * RULE_WIDTH)
             
         self.dut.cfg_reg.value = cfg_value
         await ClockCycles(self.dut.aclk, 1)
@@ -130,7 +137,7 @@ class FilterRxTestbench:
                 break
                 
         self.packets_sent += 1
-        logger.debug(f"Sent packet {self.packets_sent} ({len(beats)} beats)")
+        logger.debug("Sent packet %d (%d beats)", self.packets_sent, len(beats))
         
     async def receive_axi_stream_packet(self, timeout_cycles: int = 100):
         """
@@ -156,7 +163,7 @@ class FilterRxTestbench:
                 
                 if tlast:
                     self.packets_received += 1
-                    logger.debug(f"Received packet {self.packets_received} ({len(beats)} beats)")
+                    logger.debug("Received packet %d (%d beats)", self.packets_received, len(beats))
                     return beats
                     
                 timeout_count = 0  # Reset timeout on valid data
@@ -379,7 +386,6 @@ def ipv4_str_to_int(ip_str: str) -> int:
 
 def ipv6_str_to_int(ip_str: str) -> int:
     """Convert IPv6 string to 128-bit integer."""
-    import ipaddress
     return int(ipaddress.IPv6Address(ip_str))
 
 
@@ -400,6 +406,42 @@ def create_rule_config(rule_idx: int, ipv4_addr: str = None, ipv6_addr: str = No
     return {rule_idx: rule}
 
 
+# Integer forms of the addresses used by the common rule sets, converted once
+# at import rather than re-parsed from strings every time a rule set is built
+RULE_IPV4_ADDR_1 = ipv4_str_to_int("192.168.1.1")
+RULE_IPV4_ADDR_2 = ipv4_str_to_int("192.168.1.2")
+RULE_IPV6_ADDR_1 = ipv6_str_to_int("2001:db8::1")
+RULE_IPV6_ADDR_2 = ipv6_str_to_int("2001:db8::2")
+
+
+# Common rule set templates, built once; CommonRules hands out copies
+_IPV4_BASIC_RULES = {
+    0: {"ipv4_addr": RULE_IPV4_ADDR_1, "port": 80, "ipv6_addr": 0},
+    1: {"ipv4_addr": RULE_IPV4_ADDR_2, "port": 443, "ipv6_addr": 0}
+}
+_IPV6_BASIC_RULES = {
+    0: {"ipv6_addr": RULE_IPV6_ADDR_1, "port": 80, "ipv4_addr": 0},
+    1: {"ipv6_addr": RULE_IPV6_ADDR_2, "port": 443, "ipv4_addr": 0}
+}
+_MIXED_PROTOCOL_RULES = {
+    0: {"ipv4_addr": RULE_IPV4_ADDR_1, "port": 80, "ipv6_addr": 0},
+    1: {"ipv6_addr": RULE_IPV6_ADDR_1, "port": 443, "ipv4_addr": 0}
+}
+_PRIORITY_TEST_RULES = {
+    0: {"ipv4_addr": 0, "port": 80, "ipv6_addr": 0},  # Match any IP, port 80
+    1: {"ipv4_addr": RULE_IPV4_ADDR_1, "port": 0, "ipv6_addr": 0}  # Match specific IP, any port
+}
+_WILDCARD_PORT_RULES = {
+    0: {"ipv4_addr": RULE_IPV4_ADDR_1, "port": 0, "ipv6_addr": 0},  # Any port
+    1: {"ipv4_addr": RULE_IPV4_ADDR_2, "port": 443, "ipv6_addr": 0}  # Specific port
+}
+
+
+def _copy_rules(template: dict) -> dict:
+    """Return a copy of a rule set template that callers are free to modify."""
+    return {rule_idx: rule.copy() for rule_idx, rule in template.items()}
+
+
 # Common rule configurations for tests
 class CommonRules:
     """Common rule configurations used across tests."""
@@ -407,42 +449,27 @@ class CommonRules:
     @staticmethod
     def ipv4_basic_rules():
         """Basic IPv4 rules for testing."""
-        return {
-            0: {"ipv4_addr": ipv4_str_to_int("192.168.1.1"), "port": 80, "ipv6_addr": 0},
-            1: {"ipv4_addr": ipv4_str_to_int("192.168.1.2"), "port": 443, "ipv6_addr": 0}
-        }
+        return _copy_rules(_IPV4_BASIC_RULES)
         
     @staticmethod
     def ipv6_basic_rules():
         """Basic IPv6 rules for testing."""
-        return {
-            0: {"ipv6_addr": ipv6_str_to_int("2001:db8::1"), "port": 80, "ipv4_addr": 0},
-            1: {"ipv6_addr": ipv6_str_to_int("2001:db8::2"), "port": 443, "ipv4_addr": 0}
-        }
+        return _copy_rules(_IPV6_BASIC_RULES)
         
     @staticmethod
     def mixed_protocol_rules():
         """Mixed IPv4/IPv6 rules."""
-        return {
-            0: {"ipv4_addr": ipv4_str_to_int("192.168.1.1"), "port": 80, "ipv6_addr": 0},
-            1: {"ipv6_addr": ipv6_str_to_int("2001:db8::1"), "port": 443, "ipv4_addr": 0}
-        }
+        return _copy_rules(_MIXED_PROTOCOL_RULES)
         
     @staticmethod
     def priority_test_rules():
         """Rules for testing priority (overlapping rules)."""
-        return {
-            0: {"ipv4_addr": 0, "port": 80, "ipv6_addr": 0},  # Match any IP, port 80
-            1: {"ipv4_addr": ipv4_str_to_int("192.168.1.1"), "port": 0, "ipv6_addr": 0}  # Match specific IP, any port
-        }
+        return _copy_rules(_PRIORITY_TEST_RULES)
         
     @staticmethod
     def wildcard_port_rules():
         """Rules with wildcard ports."""
-        return {
-            0: {"ipv4_addr": ipv4_str_to_int("192.168.1.1"), "port": 0, "ipv6_addr": 0},  # Any port
-            1: {"ipv4_addr": ipv4_str_to_int("192.168.1.2"), "port": 443, "ipv6_addr": 0}  # Specific port
-        }
+        return _copy_rules(_WILDCARD_PORT_RULES)
 
 
 class TestConfig:
@@ -62,6 +62,9 @@ REQUIRED_IMPORTS = [
     'cocotb.result'
 ]
 
+# Separator rule used by the summary and test listing
+SECTION_RULE = "=" * 60
+
 
 class TestValidator:
     """Validates the Filter RX Pipeline test implementation."""
@@ -71,6 +74,16 @@ class TestValidator:
         self.test_dir = Path(test_dir)
         self.utils_dir = self.test_dir / "utils"
         self.validation_results = {}
+        self._ast_cache: Dict[str, ast.Module] = {}
+        
+    def _parse_file(self, filename: str) -> ast.Module:
+        """Parse a test file once and reuse the tree for every subsequent check."""
+        tree = self._ast_cache.get(filename)
+        if tree is None:
+            with open(self.test_dir / filename, 'r') as f:
+                tree = ast.parse(f.read())
+            self._ast_cache[filename] = tree
+        return tree
         
     def validate_file_exists(self, filename: str) -> bool:
         """Check if a file exists."""
@@ -115,9 +128,7 @@ class TestValidator:
             return False, f"File {filename} does not exist"
             
         try:
-            with open(file_path, 'r') as f:
-                source = f.read()
-            ast.parse(source)
+            self._parse_file(filename)
             return True, "Syntax OK"
         except SyntaxError as e:
             return False, f"Syntax error: {e}"
@@ -131,9 +142,7 @@ class TestValidator:
             return False, [f"File {filename} does not exist"]
             
         try:
-            with open(file_path, 'r') as f:
-                source = f.read()
-            tree = ast.parse(source)
+            tree = self._parse_file(filename)
             
             imported_modules = set()
             for node in ast.walk(tree):
@@ -161,9 +170,7 @@ class TestValidator:
             return []
             
         try:
-            with open(file_path, 'r') as f:
-                source = f.read()
-            tree = ast.parse(source)
+            tree = self._parse_file(filename)
             
             cocotb_tests = []
             for node in ast.walk(tree):
@@ -240,9 +247,8 @@ class TestValidator:
         
     def print_summary(self, results: Dict):
         """Print a summary of validation results."""
-        print("\n" + "="*60)
-        print("🎯 VALIDATION SUMMARY")
-        print("="*60)
+        # Collect the report and write it in one go rather than a print per line
+        out = ["\n" + SECTION_RULE, "🎯 VALIDATION SUMMARY", SECTION_RULE]
         
         total_files = len(TEST_COVERAGE_MAP)
         valid_files = 0
@@ -253,73 +259,76 @@ class TestValidator:
             if filename == 'utils':
                 continue
                 
-            print(f"\n📄 {filename}")
+            out.append(f"\n📄 {filename}")
             
             if not file_results['exists']:
-                print("   ❌ File missing")
+                out.append("   ❌ File missing")
                 continue
                 
             # Check syntax
             if file_results['syntax']['valid']:
-                print("   ✅ Syntax valid")
+                out.append("   ✅ Syntax valid")
             else:
-                print(f"   ❌ Syntax error: {file_results['syntax']['message']}")
+                out.append(f"   ❌ Syntax error: {file_results['syntax']['message']}")
                 continue
                 
             # Check imports
             if file_results['imports']['valid']:
-                print("   ✅ Imports complete")
+                out.append("   ✅ Imports complete")
             else:
-                print(f"   ⚠️  Missing imports: {', '.join(file_results['imports']['missing'])}")
+                out.append(f"   ⚠️  Missing imports: {', '.join(file_results['imports']['missing'])}")
                 
             # Test functions
             num_tests = len(file_results['cocotb_tests'])
             total_tests += num_tests
-            print(f"   ✅ {num_tests} Cocotb test functions")
+            out.append(f"   ✅ {num_tests} Cocotb test functions")
             
             # Coverage
             num_coverage = len(file_results['expected_coverage'])
             total_coverage += num_coverage
-            print(f"   📊 Covers {num_coverage} test cases")
+            out.append(f"   📊 Covers {num_coverage} test cases")
             
             valid_files += 1
             
-        print(f"\n📊 OVERALL STATISTICS:")
-        print(f"   Files: {valid_files}/{total_files} valid")
-        print(f"   Test functions: {total_tests}")
-        print(f"   Test coverage: {total_coverage} test cases")
-        print(f"   Utils: {'✅' if results.get('utils', {}).get('exists', False) else '❌'}")
+        utils_ok = results.get('utils', {}).get('exists', False)
+        out.append(f"\n📊 OVERALL STATISTICS:")
+        out.append(f"   Files: {valid_files}/{total_files} valid")
+        out.append(f"   Test functions: {total_tests}")
+        out.append(f"   Test coverage: {total_coverage} test cases")
+        out.append(f"   Utils: {'✅' if utils_ok else '❌'}")
         
-        if valid_files == total_files and results.get('utils', {}).get('exists', False):
-            print(f"\n🎉 ALL VALIDATION CHECKS PASSED!")
-            print(f"   The Filter RX Pipeline test implementation is complete and ready for execution.")
+        if valid_files == total_files and utils_ok:
+            out.append(f"\n🎉 ALL VALIDATION CHECKS PASSED!")
+            out.append(f"   The Filter RX Pipeline test implementation is complete and ready for execution.")
         else:
-            print(f"\n⚠️  VALIDATION ISSUES FOUND")
-            print(f"   Please address the issues above before running tests.")
+            out.append(f"\n⚠️  VALIDATION ISSUES FOUND")
+            out.append(f"   Please address the issues above before running tests.")
+            
+        sys.stdout.write("\n".join(out) + "\n")
             
     def list_all_tests(self):
         """List all available tests in all files."""
-        print("\n📋 ALL AVAILABLE TESTS")
-        print("="*60)
+        # Collect the listing and write it in one go, as print_summary does
+        out = ["\n📋 ALL AVAILABLE TESTS", SECTION_RULE]
         
         for test_file in TEST_COVERAGE_MAP.keys():
             if not (self.test_dir / test_file).exists():
                 continue
                 
-            print(f"\n📄 {test_file}")
+            out.append(f"\n📄 {test_file}")
             
             # List cocotb test functions
             cocotb_tests = self.find_cocotb_tests(test_file)
             if cocotb_tests:
-                print("   Cocotb Test Functions:")
-                for test in cocotb_tests:
-                    print(f"     🧪 {test}")
+                out.append("   Cocotb Test Functions:")
+                out.extend(f"     🧪 {test}" for test in cocotb_tests)
             
             # List expected test coverage
             expected = TEST_COVERAGE_MAP[test_file]
-            print("   Test Case Coverage:")
-            for test_case in expected:
-                print(f"     📊 {test_case}")
+            out.append("   Test Case Coverage:")
+            out.extend(f"     📊 {test_case}" for test_case in expected)
+            
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
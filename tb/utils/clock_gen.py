@@ -4,7 +4,7 @@ Provides flexible clock generation with configurable frequencies and phases.
 """
 
 import cocotb
-from cocotb.triggers import Timer
+from cocotb.triggers import Timer, RisingEdge
 from typing import Optional, Dict, Any
 import logging
 
@@ -214,8 +214,6 @@ class ClockDomainCrossing:
             clock: Clock signal to sync to
             cycles: Number of cycles to wait
         """
-        from cocotb.triggers import RisingEdge
-        
         for _ in range(cycles):
             await RisingEdge(clock)
             
@@ -231,8 +229,6 @@ class ClockDomainCrossing:
             dest_clock: Destination clock domain  
             sync_cycles: Synchronizer depth
         """
-        from cocotb.triggers import RisingEdge
-        
         # Wait for source clock edge
         await RisingEdge(source_clock)
         